@@ -11,6 +11,14 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 
+
+# 거래 목록 날짜 컬럼 표시 형식 (datetime64 → 날짜만)
+_DATE_COLUMNS = {
+    'entry_date': st.column_config.DateColumn(format="YYYY-MM-DD"),
+    'exit_date': st.column_config.DateColumn(format="YYYY-MM-DD")
+}
+
+
 class LossAnalysisEnhanced:
     """손실 분석 고도화"""
     
@@ -479,7 +487,7 @@ def render_page_loss_enhanced(converter):
         else:
             display_df = display_df.sort_values('holding_days', ascending=False)
         
-        st.dataframe(display_df, use_container_width=True, height=400)
+        st.dataframe(display_df, use_container_width=True, height=400, column_config=_DATE_COLUMNS)
     
     # ========== TAB 2: TP없이손절 심화분석 ==========
     with tab2:
@@ -563,7 +571,7 @@ def render_page_loss_enhanced(converter):
             
             display_tp = display_tp.sort_values('return_pct', ascending=True)
             
-            st.dataframe(display_tp, use_container_width=True, height=300)
+            st.dataframe(display_tp, use_container_width=True, height=300, column_config=_DATE_COLUMNS)
     
     # ========== TAB 3: 손실패턴 ==========
     with tab3:
@@ -6,6 +6,13 @@ import plotly.express as px
 from datetime import datetime
 
 
+# 거래 목록 날짜 컬럼 표시 형식 (datetime64 → 날짜만)
+_DATE_COLUMNS = {
+    'entry_date': st.column_config.DateColumn(format="YYYY-MM-DD"),
+    'exit_date': st.column_config.DateColumn(format="YYYY-MM-DD")
+}
+
+
 class ProfitAnalysisEnhanced:
     """수익 분석 고도화 모듈"""
     
@@ -458,7 +465,7 @@ def render_page_profit_enhanced(converter):
         else:
             display_df = display_df.sort_values('holding_days', ascending=False)
         
-        st.dataframe(display_df, use_container_width=True, height=400)
+        st.dataframe(display_df, use_container_width=True, height=400, column_config=_DATE_COLUMNS)
     
     # ========================================
     # Tab 2: 고수익거래
@@ -484,7 +491,7 @@ def render_page_profit_enhanced(converter):
         st.markdown("---")
         
         st.markdown('<h4 style="color: #ffffff; font-weight: bold;">📋 상위 거래 목록</h4>', unsafe_allow_html=True)
-        st.dataframe(top_trades, use_container_width=True, height=400)
+        st.dataframe(top_trades, use_container_width=True, height=400, column_config=_DATE_COLUMNS)
         
         st.markdown("---")
         
@@ -160,6 +160,9 @@ class ReturnsConverter:
             ])
         else:
             trades_df = pd.DataFrame(trades)
+            # 날짜 컬럼은 로드 시 한 번만 datetime64로 변환 (이후 재파싱 불필요)
+            for col in ('entry_date', 'exit_date'):
+                trades_df[col] = pd.to_datetime(trades_df[col], cache=True, errors='coerce')
             # Exit 날짜 기준 정렬
             trades_df = trades_df.sort_values('exit_date').reset_index(drop=True)
         
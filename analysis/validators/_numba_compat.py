@@ -0,0 +1,23 @@
+"""
+_numba_compat.py - Numba 선택적 사용
+
+numba가 설치되어 있으면 njit/prange를 그대로 사용하고,
+없으면 NUMBA_AVAILABLE = False로 두어 호출 측에서 NumPy 경로를 사용
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터를 그대로 통과 (순수 Python 함수)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
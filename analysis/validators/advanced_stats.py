@@ -123,7 +123,7 @@ class AdvancedStatistics:
         t_stat = slope / se_slope if se_slope > 0 else 0
         
         # p-value (양측)
-        p_value = 2 * (1 - stats.t.cdf(abs(t_stat), n - 2))
+        p_value = 2 * stats.t.sf(abs(t_stat), n - 2)
         
         return t_stat, p_value
     
@@ -214,7 +214,7 @@ class AdvancedStatistics:
         lb = n * (n + 2) * np.sum((acf[1:] ** 2) / (n - np.arange(1, lags + 1)))
         
         # p-value
-        p_value = 1 - stats.chi2.cdf(lb, lags)
+        p_value = stats.chi2.sf(lb, lags)
         
         return lb, p_value
     
@@ -302,7 +302,7 @@ class AdvancedStatistics:
         lm_stat = (ssr / sst) * (n / 2) if sst > 0 else 0
         
         # p-value
-        p_value = 1 - stats.chi2.cdf(lm_stat, 1)
+        p_value = stats.chi2.sf(lm_stat, 1)
         
         return lm_stat, p_value
     
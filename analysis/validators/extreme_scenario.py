@@ -11,13 +11,33 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List
-from scipy import stats
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from scipy.stats import t as t_dist
 import warnings
 
+from ._numba_compat import njit, NUMBA_AVAILABLE
+
 warnings.filterwarnings('ignore')
 
 
+@njit(cache=True)
+def _boot_means(returns, idx, out):
+    """
+    부트스트랩 평균 계산 커널 (인덱스 행렬의 각 행을 재샘플 배열 없이 바로 합산)
+    
+    난수는 호출 측 NumPy Generator가 생성 → seed/batch가 NumPy 경로와 동일하게 적용
+    parallel=True는 사용하지 않음: Numba 스레딩 계층(workqueue)은 스레드 안전하지 않아
+    Streamlit 세션 스레드에서 동시 호출 시 프로세스가 중단될 수 있음
+    """
+    n_rows, n = idx.shape
+    for k in range(n_rows):
+        s = 0.0
+        for j in range(n):
+            s += returns[idx[k, j]]
+        out[k] = s / n
+
+
 class ExtremeScenarioAnalyzer:
     """극한 상황 분석 클래스"""
     
@@ -32,9 +52,28 @@ class ExtremeScenarioAnalyzer:
         initial_capital : float
             초기 자본금 (기본값: 50달러)
         """
-        self.trades_df = trades_df.copy()
         self.initial_capital = initial_capital
-        self.returns = trades_df['return_pct'].values / 100  # 소수로 변환
+        self.returns = np.ascontiguousarray(trades_df['return_pct'].to_numpy(dtype=np.float64)) / 100.0  # 소수로 변환
+        self._capital_cache: Dict[float, np.ndarray] = {}  # 로트 비율별 자본 경로
+    
+    def _capital_path(self, fixed_lot_pct: float) -> np.ndarray:
+        """
+        고정 로트 자본 경로 (로트 비율별 캐시)
+        
+        capital_{t+1} = capital_t × (1 + 로트비율 × ret_t)
+        """
+        if fixed_lot_pct not in self._capital_cache:
+            # 성장 계수를 결과 배열에 바로 기록 후 제자리 누적곱 (중간 버퍼 없음)
+            capital_history = np.empty(len(self.returns) + 1)
+            capital_history[0] = 1.0
+            factors = capital_history[1:]
+            np.multiply(self.returns, fixed_lot_pct / 100.0, out=factors)
+            factors += 1.0
+            np.cumprod(factors, out=factors)
+            capital_history *= self.initial_capital
+            
+            self._capital_cache[fixed_lot_pct] = capital_history
+        return self._capital_cache[fixed_lot_pct]
     
     # ========== 4-4. 자본 부족 시나리오 ==========
     def analyze_capital_shortage(self, fixed_lot_pct: float = 1.0) -> Dict[str, Any]:
@@ -51,16 +90,7 @@ class ExtremeScenarioAnalyzer:
         dict
             자본 생존성 분석
         """
-        capital = self.initial_capital
-        capital_history = [capital]
-        
-        for ret in self.returns:
-            trade_size = capital * (fixed_lot_pct / 100)
-            pnl = trade_size * ret
-            capital += pnl
-            capital_history.append(capital)
-        
-        capital_history = np.array(capital_history)
+        capital_history = self._capital_path(fixed_lot_pct)
         
         shortage_stats = {
             'initial_capital': float(self.initial_capital),
@@ -82,13 +112,17 @@ class ExtremeScenarioAnalyzer:
     @staticmethod
     def _find_trades_to_ruin(capital_history: np.ndarray) -> int:
         """자산이 0 이하가 되는 거래 번호"""
-        for i, capital in enumerate(capital_history):
-            if capital <= 0:
-                return i
-        return -1  # 파산하지 않음
+        idx = np.argmax(capital_history <= 0)
+        return int(idx) if capital_history[idx] <= 0 else -1  # -1: 파산하지 않음
     
     # ========== 5-2. 부트스트랩 재샘플링 ==========
-    def bootstrap_resampling(self, n_iterations: int = 1000, confidence_level: float = 0.95) -> Dict[str, Any]:
+    def bootstrap_resampling(
+        self,
+        n_iterations: int = 1000,
+        confidence_level: float = 0.95,
+        batch: int = 512,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         부트스트랩 재샘플링으로 수익률 신뢰 구간 계산
         
@@ -98,29 +132,44 @@ class ExtremeScenarioAnalyzer:
             부트스트랩 반복 횟수
         confidence_level : float
             신뢰 수준
+        batch : int
+            한 번에 생성할 재샘플 수 (최대 메모리: batch × 거래 수)
+        seed : int, optional
+            난수 시드 (지정 시 결과 재현 가능, Numba 사용 여부와 무관)
         
         Returns:
         --------
         dict
             부트스트랩 통계
         """
-        bootstrap_means = []
-        
-        for _ in range(n_iterations):
-            # 복원 추출
-            sample = np.random.choice(self.returns, size=len(self.returns), replace=True)
-            sample_mean = sample.mean()
-            bootstrap_means.append(sample_mean * 100)  # 백분율
-        
-        bootstrap_means = np.array(bootstrap_means)
+        n = len(self.returns)
+        bootstrap_means = np.empty(n_iterations, dtype=np.float64)
+        
+        # 복원 추출: 인덱스 행렬을 배치 단위로 생성
+        # 메모리 사용량 O(batch × N + n_iterations) - 전체 (n_iterations, N) 행렬을 만들지 않음
+        rng = np.random.default_rng(seed)
+        batch = max(1, int(batch))
+        if not NUMBA_AVAILABLE:
+            # 재샘플 행렬은 float32 (메모리 절반), 평균은 float64 결과 배열에 저장
+            returns32 = self.returns.astype(np.float32)
+        
+        for start in range(0, n_iterations, batch):
+            size = min(batch, n_iterations - start)
+            idx = rng.integers(0, n, size=(size, n))
+            if NUMBA_AVAILABLE:
+                # 재샘플 배열을 만들지 않고 인덱스로 바로 합산 (float64)
+                _boot_means(self.returns, idx, bootstrap_means[start:start + size])
+            else:
+                bootstrap_means[start:start + size] = returns32[idx].mean(axis=1)
+        
+        bootstrap_means *= 100  # 백분율
         
         # 신뢰 구간
         alpha = 1 - confidence_level
         lower_percentile = alpha / 2 * 100
         upper_percentile = (1 - alpha / 2) * 100
         
-        ci_lower = np.percentile(bootstrap_means, lower_percentile)
-        ci_upper = np.percentile(bootstrap_means, upper_percentile)
+        ci_lower, ci_upper = np.percentile(bootstrap_means, [lower_percentile, upper_percentile])
         
         bootstrap_stats = {
             'n_iterations': n_iterations,
@@ -137,6 +186,100 @@ class ExtremeScenarioAnalyzer:
         
         return bootstrap_stats
     
+    def bootstrap_risk_metrics(
+        self,
+        n_iterations: int = 1000,
+        confidence_level: float = 0.95,
+        risk_free_rate: float = 0.02,
+        batch: int = 512,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        부트스트랩 재샘플링으로 Sharpe/Sortino/Calmar 신뢰 구간을 동시에 계산
+        
+        모든 지표가 같은 재샘플을 공유 (paired CI) - 재샘플 생성은 한 번만 수행
+        지표 정의는 PositionSizer.rank_risk_adjusted_returns와 동일 (연간 252 거래 기준)
+        
+        Parameters:
+        -----------
+        n_iterations : int
+            부트스트랩 반복 횟수
+        confidence_level : float
+            신뢰 수준
+        risk_free_rate : float
+            무위험 수익률 (연간)
+        batch : int
+            한 번에 생성할 재샘플 수 (최대 메모리: batch × 거래 수)
+        seed : int, optional
+            난수 시드 (지정 시 결과 재현 가능)
+        
+        Returns:
+        --------
+        dict
+            지표별 부트스트랩 신뢰 구간
+        """
+        n = len(self.returns)
+        rng = np.random.default_rng(seed)
+        batch = max(1, int(batch))
+        
+        metrics = {name: np.empty(n_iterations) for name in ('mean_return', 'sharpe_ratio', 'sortino_ratio', 'calmar_ratio')}
+        
+        for start in range(0, n_iterations, batch):
+            size = min(batch, n_iterations - start)
+            samples = self.returns[rng.integers(0, n, size=(size, n))]
+            sl = slice(start, start + size)
+            
+            means = samples.mean(axis=1)
+            annual_returns = means * 252
+            excess = annual_returns - risk_free_rate
+            
+            # Sharpe
+            annual_stds = samples.std(axis=1) * np.sqrt(252)
+            sharpes = np.divide(excess, annual_stds, out=np.zeros(size), where=annual_stds > 0)
+            
+            # Sortino (손실 거래만의 표준편차)
+            negatives = samples < 0
+            n_neg = negatives.sum(axis=1)
+            neg_values = np.where(negatives, samples, 0.0)
+            neg_means = np.divide(neg_values.sum(axis=1), n_neg, out=np.zeros(size), where=n_neg > 0)
+            neg_vars = np.divide(
+                (np.where(negatives, samples - neg_means[:, None], 0.0) ** 2).sum(axis=1),
+                n_neg, out=np.zeros(size), where=n_neg > 0
+            )
+            annual_downside = np.sqrt(neg_vars) * np.sqrt(252)
+            sortinos = np.divide(excess, annual_downside, out=np.zeros(size), where=annual_downside > 0)
+            
+            # Calmar (자산 / 직전 고점 - 1)
+            cumulative = np.cumprod(1 + samples, axis=1)
+            running_max = np.maximum(np.maximum.accumulate(cumulative, axis=1), 1.0)
+            max_drawdowns = -(cumulative / running_max - 1.0).min(axis=1)
+            calmars = np.divide(annual_returns, max_drawdowns, out=np.zeros(size), where=max_drawdowns > 0)
+            
+            metrics['mean_return'][sl] = means * 100  # 백분율
+            metrics['sharpe_ratio'][sl] = sharpes
+            metrics['sortino_ratio'][sl] = sortinos
+            metrics['calmar_ratio'][sl] = calmars
+        
+        # 신뢰 구간 (모든 지표 한 번에)
+        alpha = 1 - confidence_level
+        stacked = np.vstack(list(metrics.values()))
+        ci_lower, ci_upper = np.percentile(stacked, [alpha / 2 * 100, (1 - alpha / 2) * 100], axis=1)
+        
+        risk_metric_stats = {
+            'n_iterations': n_iterations,
+            'confidence_level': confidence_level
+        }
+        
+        for i, (name, values) in enumerate(metrics.items()):
+            risk_metric_stats[name] = {
+                'bootstrap_mean': float(values.mean()),
+                'bootstrap_std': float(values.std()),
+                'confidence_interval_lower': float(ci_lower[i]),
+                'confidence_interval_upper': float(ci_upper[i])
+            }
+        
+        return risk_metric_stats
+    
     # ========== 5-3. 극단값 분포 ==========
     def analyze_extreme_values(self, percentile: int = 10) -> Dict[str, Any]:
         """
@@ -154,12 +297,14 @@ class ExtremeScenarioAnalyzer:
         """
         returns_pct = self.returns * 100
         
-        # 상위/하위 거래
-        lower_bound = np.percentile(returns_pct, percentile)
-        upper_bound = np.percentile(returns_pct, 100 - percentile)
+        # 상위/하위 거래 (부분 정렬 O(N): 하위 k개 / 상위 k개만 분리)
+        # k = np.percentile(선형 보간) 경계 이하/이상 거래 수 (동률이 없을 때 기존 마스크 방식과 동일)
+        n = len(returns_pct)
+        k = int(percentile / 100 * (n - 1)) + 1
+        part = np.partition(returns_pct, [k - 1, n - k])
         
-        worst_trades = returns_pct[returns_pct <= lower_bound]
-        best_trades = returns_pct[returns_pct >= upper_bound]
+        worst_trades = part[:k]
+        best_trades = part[-k:]
         
         extreme_stats = {
             'percentile': percentile,
@@ -201,19 +346,9 @@ class ExtremeScenarioAnalyzer:
         trades_per_month = len(self.returns) / 12 if len(self.returns) > 0 else 1
         monthly_return = np.mean(self.returns) * trades_per_month
         
-        # 시뮬레이션
-        simulated_capitals = [self.initial_capital]
-        
-        for month in range(months_ahead):
-            current_capital = simulated_capitals[-1]
-            
-            # 해당 월의 수익
-            month_pnl = current_capital * monthly_return
-            new_capital = current_capital + month_pnl
-            
-            simulated_capitals.append(new_capital)
-        
-        simulated_capitals = np.array(simulated_capitals)
+        # 시뮬레이션: C_m = C_0 × (1 + 월 수익률)^m
+        months = np.arange(months_ahead + 1)
+        simulated_capitals = self.initial_capital * np.power(1.0 + monthly_return, months)
         
         # 95% 신뢰도 범위 (표준편차 기반)
         monthly_std = np.std(self.returns) * np.sqrt(trades_per_month)
@@ -225,7 +360,7 @@ class ExtremeScenarioAnalyzer:
             'simulated_months': months_ahead,
             'expected_final_capital': float(simulated_capitals[-1]),
             'expected_growth_pct': float((simulated_capitals[-1] - self.initial_capital) / self.initial_capital * 100),
-            'monthly_progression': [float(c) for c in simulated_capitals],
+            'monthly_progression': simulated_capitals.tolist(),
             'confidence_upper_bound': float(simulated_capitals[-1] * (1 + monthly_std)),
             'confidence_lower_bound': float(simulated_capitals[-1] * (1 - monthly_std))
         }
@@ -248,37 +383,11 @@ class ExtremeScenarioAnalyzer:
             회귀선 분석
         """
         # 자본 누적 곡선
-        capital = self.initial_capital
-        capital_history = [capital]
-        
-        for ret in self.returns:
-            trade_size = capital * (fixed_lot_pct / 100)
-            pnl = trade_size * ret
-            capital += pnl
-            capital_history.append(capital)
-        
-        capital_history = np.array(capital_history)
+        capital_history = self._capital_path(fixed_lot_pct)
         
-        # 회귀선
-        x = np.arange(len(capital_history))
-        y = capital_history
-        
-        # 선형 회귀
-        z = np.polyfit(x, y, 1)
-        p = np.poly1d(z)
-        
-        # R² 계산
-        y_pred = p(x)
-        ss_res = np.sum((y - y_pred) ** 2)
-        ss_tot = np.sum((y - np.mean(y)) ** 2)
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
-        
-        # 기울기와 절편
-        slope = z[0]
-        intercept = z[1]
-        
-        # 기울기의 유의성 검정
-        slope_pvalue = self._calculate_slope_pvalue(x, y, slope)
+        # 선형 회귀 (x = 0..n-1 이므로 x 관련 합은 닫힌 형태로 계산)
+        slope, intercept, r_value, slope_pvalue = self._fit_linear_trend(capital_history)
+        r_squared = r_value ** 2
         
         regression_stats = {
             'slope': float(slope),
@@ -286,7 +395,7 @@ class ExtremeScenarioAnalyzer:
             'slope_pvalue': float(slope_pvalue),
             'slope_significant': slope_pvalue < 0.05,
             'r_squared': float(r_squared),
-            'r_value': float(np.sqrt(abs(r_squared))),
+            'r_value': float(r_value),
             'trend': '우상향' if slope > 0 else '하향',
             'trend_strength': self._interpret_r_squared(r_squared),
             'daily_expected_growth': float(slope),
@@ -296,31 +405,46 @@ class ExtremeScenarioAnalyzer:
         return regression_stats
     
     @staticmethod
-    def _calculate_slope_pvalue(x: np.ndarray, y: np.ndarray, slope: float) -> float:
-        """회귀선 기울기의 p-value 계산"""
-        n = len(x)
-        x_mean = np.mean(x)
-        y_mean = np.mean(y)
+    def _fit_linear_trend(y: np.ndarray) -> Tuple[float, float, float, float]:
+        """
+        x = 0, 1, ..., n-1 에 대한 단순 선형 회귀
+        
+        sum(x) = n(n-1)/2, sum((x - x̄)²) = n(n²-1)/12 을 이용해 y만 순회
+        
+        Returns:
+        --------
+        tuple
+            (기울기, 절편, 상관계수 r, 기울기 p-value)
+        """
+        n = len(y)
+        if n < 3:
+            return 0.0, float(y[0]) if n else 0.0, 0.0, 1.0
         
-        ss_x = np.sum((x - x_mean) ** 2)
-        ss_y = np.sum((y - y_mean) ** 2)
-        ss_xy = np.sum((x - x_mean) * (y - y_mean))
+        x_mean = (n - 1) / 2.0
+        ss_x = n * (n * n - 1) / 12.0
+        y_mean = y.mean()
         
-        # 회귀 표준오차
-        residuals = y - (slope * x + np.mean(y) - slope * x_mean)
-        mse = np.sum(residuals ** 2) / (n - 2)
+        y_dev = y - y_mean
+        ss_y = np.dot(y_dev, y_dev)
+        ss_xy = np.dot(y_dev, np.arange(n))  # sum((x - x̄)(y - ȳ)) = sum(x (y - ȳ))
         
-        # 기울기 표준오차
-        se_slope = np.sqrt(mse / ss_x) if ss_x > 0 else 0
+        slope = ss_xy / ss_x
+        intercept = y_mean - slope * x_mean
         
-        # t-통계량
-        t_stat = slope / se_slope if se_slope > 0 else 0
+        if ss_y <= 0:
+            return float(slope), float(intercept), 0.0, 1.0
         
-        # p-value (양측)
-        from scipy.stats import t as t_dist
-        p_value = 2 * (1 - t_dist.cdf(abs(t_stat), n - 2))
+        r_value = float(np.clip(ss_xy / np.sqrt(ss_x * ss_y), -1.0, 1.0))
+        
+        # 기울기 t-검정 (자유도 n-2)
+        ss_res = max(ss_y - slope * ss_xy, 0.0)
+        se_slope = np.sqrt(ss_res / (n - 2) / ss_x)
+        if se_slope > 0:
+            p_value = 2 * t_dist.sf(abs(slope / se_slope), n - 2)
+        else:
+            p_value = 0.0  # 완전한 직선
         
-        return p_value
+        return float(slope), float(intercept), r_value, float(p_value)
     
     @staticmethod
     def _interpret_r_squared(r_squared: float) -> str:
@@ -337,22 +461,35 @@ class ExtremeScenarioAnalyzer:
             return "매우 약함 (추세 불명확)"
     
     # ========== 모든 분석 통합 실행 ==========
-    def run_all(self) -> Dict[str, Any]:
+    def run_all(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         극한 상황 분석 5개 항목 모두 실행
         
+        Parameters:
+        -----------
+        max_workers : int, optional
+            지정 시 각 분석을 별도 프로세스에서 병렬 실행 (기본값: 순차 실행)
+        
         Returns:
         --------
         dict
             모든 분석 결과
         """
-        results = {
-            '4-4_capital_shortage': self.analyze_capital_shortage(),
-            '5-2_bootstrap': self.bootstrap_resampling(),
-            '5-3_extreme_values': self.analyze_extreme_values(),
-            '6-2_capital_growth': self.simulate_capital_growth(),
-            '6-3_capital_regression': self.analyze_capital_regression()
-        }
+        tasks = [
+            ('4-4_capital_shortage', 'analyze_capital_shortage'),
+            ('5-2_bootstrap', 'bootstrap_resampling'),
+            ('5-3_extreme_values', 'analyze_extreme_values'),
+            ('6-2_capital_growth', 'simulate_capital_growth'),
+            ('6-3_capital_regression', 'analyze_capital_regression')
+        ]
+        
+        if max_workers:
+            # 분석 항목들은 서로 독립적 → 프로세스 풀로 분산 (GIL 회피)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {name: executor.submit(getattr(self, method)) for name, method in tasks}
+                return {name: future.result() for name, future in futures.items()}
+        
+        results = {name: getattr(self, method)() for name, method in tasks}
         
         return results
 
@@ -9,9 +9,45 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
 from scipy import stats
 
+from ._numba_compat import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def _kelly_stats(returns):
+    """승/패 거래 수와 합계를 한 번의 순회로 계산"""
+    n_pos = 0
+    s_pos = 0.0
+    n_neg = 0
+    s_neg = 0.0
+    for x in returns:
+        if x > 0:
+            n_pos += 1
+            s_pos += x
+        elif x < 0:
+            n_neg += 1
+            s_neg += x
+    return n_pos, s_pos, n_neg, s_neg
+
+
+# 성과 점수/Sharpe 구간 경계 (값 > 경계 이면 다음 구간)
+_SCORE_THRESHOLDS = np.array([0.5, 1.0, 1.5, 2.0])
+
+# 구간별 성과 순위
+_RANK_LABELS = [
+    "하위 25% (개선 필요)",
+    "평균 (보통)",
+    "상위 50% (양호)",
+    "상위 25% (우수)",
+    "상위 10% (매우 우수)"
+]
+
+# 구간별 로트 멀티플라이어 (Sharpe가 낮을수록 로트 감소)
+_LOT_MULTIPLIERS = np.array([0.2, 0.4, 0.6, 0.8, 1.0])
+
 
 class PositionSizer:
     """포지션 사이징 클래스"""
@@ -27,9 +63,12 @@ class PositionSizer:
         risk_free_rate : float
             무위험 수익률 (연간, 기본값: 2%)
         """
-        self.trades_df = trades_df.copy()
         self.risk_free_rate = risk_free_rate
-        self.returns = trades_df['return_pct'].values / 100  # 소수로 변환
+        self.returns = np.ascontiguousarray(trades_df['return_pct'].to_numpy(dtype=np.float64)) / 100.0  # 소수로 변환
+        
+        # 누적 수익/고점 계산용 재사용 버퍼 (첫 사용 시 할당, 반복 호출 시 재할당 방지)
+        self._scratch_cum: Optional[np.ndarray] = None
+        self._scratch_peak: Optional[np.ndarray] = None
     
     # ========== 7-3. 위험 조정 성과 순위 ==========
     def rank_risk_adjusted_returns(self) -> Dict[str, Any]:
@@ -66,10 +105,20 @@ class PositionSizer:
         sortino_ratio = (annual_return - self.risk_free_rate) / annual_downside_std if annual_downside_std > 0 else 0
         
         # Calmar Ratio = 연간 수익 / 최대 드로우다운
-        cumulative_returns = (1 + returns).cumprod() - 1
-        running_max = np.maximum.accumulate(cumulative_returns)
-        drawdown = (cumulative_returns - running_max) / (running_max + 0.0001)
-        max_drawdown = abs(drawdown.min())
+        # 드로우다운 = 자산 / 직전 고점 - 1 (고점은 초기 자산 1.0 이상)
+        if self._scratch_cum is None:
+            self._scratch_cum = np.empty_like(returns)
+            self._scratch_peak = np.empty_like(returns)
+        
+        cumulative = self._scratch_cum
+        np.add(returns, 1.0, out=cumulative)
+        np.cumprod(cumulative, out=cumulative)
+        
+        ratio = self._scratch_peak
+        np.maximum.accumulate(cumulative, out=ratio)
+        np.maximum(ratio, 1.0, out=ratio)
+        np.divide(cumulative, ratio, out=ratio)  # 자산 / 고점
+        max_drawdown = 1.0 - ratio.min() if len(ratio) > 0 else 0.0
         
         calmar_ratio = annual_return / max_drawdown if max_drawdown > 0 else 0
         
@@ -93,16 +142,8 @@ class PositionSizer:
         scores = [sharpe, sortino, calmar]
         avg_score = np.mean(scores)
         
-        if avg_score > 2.0:
-            rank = "상위 10% (매우 우수)"
-        elif avg_score > 1.5:
-            rank = "상위 25% (우수)"
-        elif avg_score > 1.0:
-            rank = "상위 50% (양호)"
-        elif avg_score > 0.5:
-            rank = "평균 (보통)"
-        else:
-            rank = "하위 25% (개선 필요)"
+        rank_idx = 0 if np.isnan(avg_score) else int(np.searchsorted(_SCORE_THRESHOLDS, avg_score))
+        rank = _RANK_LABELS[rank_idx]
         
         return {
             'average_score': float(avg_score),
@@ -123,15 +164,20 @@ class PositionSizer:
         """
         returns = self.returns * 100  # 백분율로 변환
         
-        # 승리/손실 거래
-        wins = returns[returns > 0]
-        losses = returns[returns < 0]
+        # 승리/손실 거래 (마스크 복사본 없이 개수/합계만 계산)
+        if NUMBA_AVAILABLE:
+            n_wins, sum_wins, n_losses, sum_losses = _kelly_stats(returns)
+        else:
+            n_wins = np.count_nonzero(returns > 0)
+            n_losses = np.count_nonzero(returns < 0)
+            sum_wins = np.where(returns > 0, returns, 0.0).sum()
+            sum_losses = np.where(returns < 0, returns, 0.0).sum()
         
-        win_rate = len(wins) / len(returns) if len(returns) > 0 else 0
-        loss_rate = len(losses) / len(returns) if len(returns) > 0 else 0
+        win_rate = n_wins / len(returns) if len(returns) > 0 else 0
+        loss_rate = n_losses / len(returns) if len(returns) > 0 else 0
         
-        avg_win = wins.mean() if len(wins) > 0 else 0
-        avg_loss = abs(losses.mean()) if len(losses) > 0 else 0
+        avg_win = sum_wins / n_wins if n_wins > 0 else 0
+        avg_loss = abs(sum_losses / n_losses) if n_losses > 0 else 0
         
         # Kelly Criterion
         # f = (p × b - q) / b
@@ -200,46 +246,32 @@ class PositionSizer:
         """
         returns = self.returns * 100
         
-        # 기간별로 나누기
+        # 기간별로 나누기 ((n_periods, 기간 길이) 행렬로 재구성, 남는 거래는 제외)
         total_trades = len(returns)
         n_periods = max(1, total_trades // period_days)
+        block_len = min(period_days, total_trades)
         
-        period_sharpes = []
-        period_lot_multipliers = []
-        
-        for i in range(n_periods):
-            start_idx = i * period_days
-            end_idx = min((i + 1) * period_days, total_trades)
+        if block_len > 0:
+            blocks = returns[:n_periods * block_len].reshape(n_periods, block_len)
+            period_means = blocks.mean(axis=1)
+            period_stds = blocks.std(axis=1)
             
-            period_returns = returns[start_idx:end_idx]
+            # Sharpe 계산
+            annual_returns = period_means * 252 / block_len
+            annual_stds = period_stds * np.sqrt(252)
+            safe_stds = np.where(annual_stds > 0, annual_stds, 1.0)
+            period_sharpes = np.where(
+                annual_stds > 0,
+                (annual_returns - self.risk_free_rate) / safe_stds,
+                0.0
+            )
             
-            if len(period_returns) > 0:
-                period_mean = period_returns.mean()
-                period_std = period_returns.std()
-                
-                # Sharpe 계산
-                annual_return = period_mean * 252 / len(period_returns)
-                annual_std = period_std * np.sqrt(252)
-                
-                period_sharpe = (annual_return - self.risk_free_rate) / annual_std if annual_std > 0 else 0
-                period_sharpes.append(period_sharpe)
-                
-                # 로트 멀티플라이어 결정
-                if period_sharpe > 2.0:
-                    multiplier = 1.0  # 정상
-                elif period_sharpe > 1.5:
-                    multiplier = 0.8  # 감소
-                elif period_sharpe > 1.0:
-                    multiplier = 0.6  # 감소
-                elif period_sharpe > 0.5:
-                    multiplier = 0.4  # 크게 감소
-                else:
-                    multiplier = 0.2  # 극도로 감소
-                
-                period_lot_multipliers.append(multiplier)
-        
-        period_sharpes = np.array(period_sharpes)
-        period_lot_multipliers = np.array(period_lot_multipliers)
+            # 로트 멀티플라이어 결정
+            # Sharpe > 2.0: 1.0 (정상), > 1.5: 0.8, > 1.0: 0.6, > 0.5: 0.4, 그 외: 0.2 (극도로 감소)
+            period_lot_multipliers = _LOT_MULTIPLIERS[np.searchsorted(_SCORE_THRESHOLDS, period_sharpes)]
+        else:
+            period_sharpes = np.array([])
+            period_lot_multipliers = np.array([])
         
         dynamic_stats = {
             'base_lot_pct': float(base_lot_pct),
@@ -257,20 +289,33 @@ class PositionSizer:
         return dynamic_stats
     
     # ========== 모든 분석 통합 실행 ==========
-    def run_all(self) -> Dict[str, Any]:
+    def run_all(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         포지션 최적화 3개 항목 모두 실행
         
+        Parameters:
+        -----------
+        max_workers : int, optional
+            지정 시 각 분석을 별도 프로세스에서 병렬 실행 (기본값: 순차 실행)
+        
         Returns:
         --------
         dict
             모든 분석 결과
         """
-        results = {
-            '7-3_risk_adjusted': self.rank_risk_adjusted_returns(),
-            '9-1_kelly': self.calculate_kelly(),
-            '9-3_dynamic_lot': self.calculate_dynamic_lot()
-        }
+        tasks = [
+            ('7-3_risk_adjusted', 'rank_risk_adjusted_returns'),
+            ('9-1_kelly', 'calculate_kelly'),
+            ('9-3_dynamic_lot', 'calculate_dynamic_lot')
+        ]
+        
+        if max_workers:
+            # 분석 항목들은 서로 독립적 → 프로세스 풀로 분산 (GIL 회피)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {name: executor.submit(getattr(self, method)) for name, method in tasks}
+                return {name: future.result() for name, future in futures.items()}
+        
+        results = {name: getattr(self, method)() for name, method in tasks}
         
         return results
 
@@ -8,11 +8,120 @@
 2-4. 손실 꼬리 리스크 (VaR, CVaR)
 """
 
+import math
 import pandas as pd
 import numpy as np
-from scipy import stats
-from typing import Dict, Tuple, Any
-from scipy.stats import binom, t
+from scipy import stats, special
+from typing import Dict, Tuple, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from scipy.stats import t
+from scipy.special import bdtr, bdtrc
+
+from ._numba_compat import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True, boundscheck=False)
+def _summary(returns):
+    """
+    한 번의 순회로 평균, 중심 적률 합(M2/M3/M4), 최소/최대, 승/패/무 개수 계산
+    
+    원점 적률 합(Σx², Σx³, Σx⁴)은 평균이 큰 데이터에서 상쇄 오차가 커지므로
+    Welford/Pébay 온라인 갱신식으로 중심 적률을 직접 누적
+    
+    Returns:
+    --------
+    tuple
+        (mean, m2, m3, m4, vmin, vmax, wins, losses, zeros)
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    vmin = np.inf
+    vmax = -np.inf
+    wins = 0
+    losses = 0
+    zeros = 0
+    has_nan = False
+    for x in returns:
+        n_old = n
+        n += 1
+        delta = x - mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term1 = delta * delta_n * n_old
+        mean += delta_n
+        m4 += term1 * delta_n2 * (n * n - 3 * n + 3) + 6 * delta_n2 * m2 - 4 * delta_n * m3
+        m3 += term1 * delta_n * (n - 2) - 3 * delta_n * m2
+        m2 += term1
+        if x < vmin:
+            vmin = x
+        if x > vmax:
+            vmax = x
+        if x > 0:
+            wins += 1
+        elif x < 0:
+            losses += 1
+        elif x == 0:
+            zeros += 1
+        else:
+            has_nan = True
+    if has_nan:
+        # NaN이 있으면 min/max도 NaN (ndarray.min/max와 동일)
+        vmin = np.nan
+        vmax = np.nan
+    return mean, m2, m3, m4, vmin, vmax, wins, losses, zeros
+
+
+if NUMBA_AVAILABLE:
+    # 임포트 시 float64/float32 특수화를 미리 준비 (cache=True이므로 두 번째 실행부터는 디스크 캐시 로드만 수행)
+    # → 첫 run_all 호출이 JIT 컴파일 시간을 부담하지 않음
+    for _dtype in (np.float64, np.float32):
+        _summary(np.zeros(2, dtype=_dtype))
+    del _dtype
+
+
+# 수익률 컬럼 후보 (앞쪽이 우선)
+_RETURN_COLUMNS = ('return_pct', '거래 반환', 'Return', '수익률', 'profit_loss')
+
+# 이 거래 수 이상이면 수익률을 float32로 보관 (정렬/탐색/KS의 메모리 대역폭 절반)
+# 적률 누적은 float64 누산기에서 수행하므로 평균/표준편차 정확도는 유지
+_FLOAT32_MIN_TRADES = 1_000_000
+
+# 검정별 최소 거래 수 (Shapiro-Wilk는 n >= 3, KS 점근/정확 분포는 소표본에서 신뢰도 낮음)
+_MIN_TRADES = 3
+_MIN_TRADES_KS = 30
+
+# 신뢰 수준별 양측 임계 z값 캐시 (norm.ppf 반복 호출 방지)
+_Z_CACHE: Dict[float, float] = {}
+
+
+def _z(level: float) -> float:
+    """양측 신뢰 수준 level의 임계 z값 (norm.ppf((1 + level) / 2)), 수준별로 한 번만 계산"""
+    z = _Z_CACHE.get(level)
+    if z is None:
+        z = _Z_CACHE[level] = float(stats.norm.ppf((1 + level) / 2))
+    return z
+
+
+def _sorted_quantile(sorted_values: np.ndarray, q: float):
+    """
+    정렬된 배열의 마지막 축에서 분위수 조회 (np.percentile 선형 보간과 동일)
+    
+    Parameters:
+    -----------
+    sorted_values : np.ndarray
+        마지막 축 기준으로 정렬된 배열 (1차원 또는 전략 × 거래 2차원)
+    q : float
+        백분위 (0~100)
+    """
+    n = sorted_values.shape[-1]
+    pos = q / 100 * (n - 1)
+    lo = int(pos)
+    hi = min(lo + 1, n - 1)
+    lo_values = sorted_values[..., lo]
+    return lo_values + (pos - lo) * (sorted_values[..., hi] - lo_values)
 
 
 class StatisticalTester:
@@ -28,26 +137,59 @@ class StatisticalTester:
             거래 데이터프레임
             필수 컬럼: return_pct (또는 profit_loss)
         """
-        self.trades_df = trades_df.copy()
-        self._normalize_columns()
-        
-        self.returns = self.trades_df['return_pct'].values
+        # 사용하는 컬럼은 수익률 하나뿐이므로 DataFrame 복사 없이 배열만 추출
+        col = next((c for c in _RETURN_COLUMNS if c in trades_df.columns), 'return_pct')
+        dtype = np.float32 if len(trades_df) >= _FLOAT32_MIN_TRADES else np.float64
+        self.returns = np.ascontiguousarray(trades_df[col].to_numpy(dtype=dtype, copy=False))
         self.n_trades = len(self.returns)
-        self.win_rate = (self.returns > 0).sum() / self.n_trades if self.n_trades > 0 else 0
+        
+        # 검정 간 공유하는 요약 통계 (한 번만 계산)
+        self._sorted = np.sort(self.returns)
+        if NUMBA_AVAILABLE:
+            (self._mean, self._m2, self._m3, self._m4, self._min, self._max,
+             self._wins, self._losses, self._zeros) = _summary(self.returns)
+        elif self.n_trades > 0:
+            self._mean = self.returns.mean(dtype=np.float64)
+            dev = self.returns - self._mean
+            dev2 = dev * dev
+            self._m2 = dev2.sum()
+            self._m3 = (dev2 * dev).sum()
+            self._m4 = (dev2 * dev2).sum()
+            # np.sort는 NaN을 끝에 두므로 마지막 값으로 NaN 여부 판단
+            has_nan = np.isnan(self._sorted[-1])
+            self._min = np.nan if has_nan else self._sorted[0]
+            self._max = self._sorted[-1]
+            self._wins = int(np.count_nonzero(self.returns > 0))
+            self._zeros = int(np.count_nonzero(self.returns == 0))
+            if has_nan:
+                # NaN은 승/패/무 어디에도 포함하지 않음 (Numba 커널과 동일)
+                self._losses = int(np.count_nonzero(self.returns < 0))
+            else:
+                self._losses = self.n_trades - self._wins - self._zeros
+        else:
+            self._mean = self._m2 = self._m3 = self._m4 = 0.0
+            self._min = self._max = np.nan
+            self._wins = self._losses = self._zeros = 0
+        
+        # 모집단 표준편차 (ddof=0), 왜도/첨도 (scipy bias=True 기준)
+        n = max(self.n_trades, 1)
+        self._std = math.sqrt(self._m2 / n)
+        var = self._m2 / n
+        self._skew = (self._m3 / n) / (var * math.sqrt(var)) if var > 0 else np.nan
+        self._kurt = (self._m4 / n) / (var * var) - 3 if var > 0 else np.nan
+        
+        self.win_rate = self._wins / self.n_trades if self.n_trades > 0 else 0
     
-    def _normalize_columns(self):
-        """컬럼명 정규화"""
-        column_mapping = {
-            '거래 반환': 'return_pct',
-            'Return': 'return_pct',
-            '수익률': 'return_pct',
-            'return_pct': 'return_pct',
-            'profit_loss': 'return_pct'
-        }
+    def _quantile(self, q: float) -> float:
+        """
+        정렬된 수익률에서 분위수 조회 (np.percentile 선형 보간과 동일)
         
-        for old_col, new_col in column_mapping.items():
-            if old_col in self.trades_df.columns and new_col not in self.trades_df.columns:
-                self.trades_df[new_col] = self.trades_df[old_col]
+        Parameters:
+        -----------
+        q : float
+            백분위 (0~100)
+        """
+        return float(_sorted_quantile(self._sorted, q))
     
     # ========== 2-1. 승률 통계 신뢰도 ==========
     def test_win_rate_confidence(self, confidence_level: float = 0.95) -> Dict[str, Any]:
@@ -66,21 +208,24 @@ class StatisticalTester:
         dict
             승률 신뢰도 통계
         """
-        wins = (self.returns > 0).sum()
-        losses = (self.returns <= 0).sum()
+        wins = self._wins
+        losses = self.n_trades - wins
         
         # 이항분포 검정 (귀무가설: p = 0.5)
         # H0: 승률 = 50% (동전 던지기와 동일)
         # H1: 승률 ≠ 50% (동전 던지기와 다름)
         
-        p_value = binom.sf(wins - 1, self.n_trades, 0.5) * 2  # 양측 검정
+        # 양측 검정: 2 × min(P(X ≥ wins), P(X ≤ wins)), 최대 1
+        p_upper = bdtrc(wins - 1, self.n_trades, 0.5)
+        p_lower = bdtr(wins, self.n_trades, 0.5)
+        p_value = min(1.0, 2 * min(p_upper, p_lower))
         
         # 신뢰 구간 계산 (Wilson Score)
         ci_lower, ci_upper = self._wilson_ci(wins, self.n_trades, confidence_level)
         
         # Z-score 계산
         p_null = 0.5
-        std_error = np.sqrt(p_null * (1 - p_null) / self.n_trades)
+        std_error = math.sqrt(p_null * (1 - p_null) / self.n_trades)
         z_score = (self.win_rate - p_null) / std_error if std_error > 0 else 0
         
         # 필요 표본 수 (50% 승률 vs 관측 승률)
@@ -100,26 +245,50 @@ class StatisticalTester:
             'ci_range_pct': float((ci_upper - ci_lower) * 100),
             'z_score': float(z_score),
             'confidence_assessment': self._assess_confidence(p_value),
-            'required_trades_for_significance': int(required_trades)
+            'required_trades_for_significance': int(required_trades) if math.isfinite(required_trades) else None
         }
         
         return win_rate_stats
     
     @staticmethod
-    def _wilson_ci(wins: int, n: int, confidence_level: float = 0.95) -> Tuple[float, float]:
+    def _wilson_ci(wins, n, confidence_level: float = 0.95):
         """
         Wilson Score 신뢰 구간 계산
         
         이항분포의 신뢰 구간을 더 정확하게 계산
-        """
-        p_hat = wins / n if n > 0 else 0
-        z = stats.norm.ppf((1 + confidence_level) / 2)
+        닫힌 형태: (2np̂ + z² ± z·√(4np̂(1-p̂) + z²)) / (2(n + z²))
         
-        denominator = 1 + z**2 / n
-        center = (p_hat + z**2 / (2*n)) / denominator
-        spread = z * np.sqrt(p_hat * (1 - p_hat) / n + z**2 / (4*n**2)) / denominator
+        Parameters:
+        -----------
+        wins : int 또는 np.ndarray
+            승리 거래 수 (배열이면 여러 전략을 한 번에 계산)
+        n : int 또는 np.ndarray
+            전체 거래 수
+        confidence_level : float
+            신뢰 수준
         
-        return max(0, center - spread), min(1, center + spread)
+        Returns:
+        --------
+        tuple
+            (하한, 상한) - 스칼라 입력이면 float, 배열 입력이면 np.ndarray
+        """
+        wins_arr = np.asarray(wins, dtype=np.float64)
+        n_arr = np.asarray(n, dtype=np.float64)
+        z = _z(confidence_level)
+        z2 = z * z
+        
+        # 4np̂(1-p̂) = 4·wins·(n - wins) / n  (n = 0이면 0)
+        var_term = np.divide(4 * wins_arr * (n_arr - wins_arr), n_arr,
+                             out=np.zeros(np.broadcast(wins_arr, n_arr).shape), where=n_arr > 0)
+        denom = 2 * (n_arr + z2)
+        center = (2 * wins_arr + z2) / denom
+        half = z * np.sqrt(var_term + z2) / denom
+        
+        lower = np.maximum(0.0, center - half)
+        upper = np.minimum(1.0, center + half)
+        if lower.ndim == 0:
+            return float(lower), float(upper)
+        return lower, upper
     
     @staticmethod
     def _calculate_required_sample_size(p1: float, p2: float, alpha: float = 0.05, beta: float = 0.20) -> float:
@@ -136,13 +305,23 @@ class StatisticalTester:
             유의 수준
         beta : float
             검정력 (1 - beta)
+        
+        Returns:
+        --------
+        float
+            필요 표본 수 (두 비율이 같으면 어떤 표본으로도 구분 불가 → inf)
         """
-        z_alpha = stats.norm.ppf(1 - alpha / 2)
-        z_beta = stats.norm.ppf(1 - beta)
+        diff = p1 - p2
+        if diff == 0:
+            return math.inf
+        
+        z_alpha = _z(1 - alpha)       # norm.ppf(1 - alpha / 2)
+        z_beta = _z(1 - 2 * beta)     # norm.ppf(1 - beta)
         
         p_pool = (p1 + p2) / 2
         
-        n = (z_alpha + z_beta)**2 * (2 * p_pool * (1 - p_pool)) / (p1 - p2)**2
+        z_sum = z_alpha + z_beta
+        n = z_sum * z_sum * (2 * p_pool * (1 - p_pool)) / (diff * diff)
         
         return max(0, n)
     
@@ -159,31 +338,50 @@ class StatisticalTester:
             return "낮음"
     
     # ========== 2-2. 수익률 유의성 ==========
-    def test_profit_significance(self) -> Dict[str, Any]:
+    def test_profit_significance(self, confidence_level: float = 0.95) -> Dict[str, Any]:
         """
         수익률의 통계적 유의성 검정
         
         일일 수익률이 0보다 크다는 것을 검정
         
+        Parameters:
+        -----------
+        confidence_level : float 또는 배열
+            평균 수익률 신뢰 구간의 신뢰 수준 (기본값: 95%)
+            여러 수준을 배열로 주면 신뢰 구간도 수준별 리스트로 반환
+        
         Returns:
         --------
         dict
             수익률 유의성 통계
         """
-        # 일일 수익률
-        daily_returns = self.returns
-        
-        # t-검정 (귀무가설: 평균 = 0)
-        t_stat, p_value = stats.ttest_1samp(daily_returns, 0)
+        # t-검정 (귀무가설: 평균 = 0), 캐시된 적률로 직접 계산 (표본 표준편차 ddof=1)
+        n = self.n_trades
+        if n > 1 and self._m2 > 0:
+            t_stat = self._mean / math.sqrt(self._m2 / (n - 1) / n)
+            p_value = 2 * t.sf(abs(t_stat), n - 1)
+        elif n > 1 and self._mean != 0:
+            # 분산 0인 비영(非零) 상수 수익률: ttest_1samp와 동일하게 t = ±inf, p = 0
+            t_stat = math.copysign(math.inf, self._mean)
+            p_value = 0.0
+        else:
+            t_stat, p_value = np.nan, np.nan
         
         # 평균과 표준편차
-        mean_return = daily_returns.mean()
-        std_return = daily_returns.std()
-        se_return = std_return / np.sqrt(len(daily_returns)) if len(daily_returns) > 0 else 0
-        
-        # 신뢰 구간 (95%)
-        ci_lower = mean_return - 1.96 * se_return
-        ci_upper = mean_return + 1.96 * se_return
+        mean_return = self._mean
+        std_return = self._std
+        se_return = std_return / math.sqrt(n) if n > 0 else 0
+        
+        # 신뢰 구간 (정규 근사)
+        if np.ndim(confidence_level) == 0:
+            z = _z(float(confidence_level))
+            ci_lower = float(mean_return - z * se_return)
+            ci_upper = float(mean_return + z * se_return)
+        else:
+            confidence_level = [float(level) for level in confidence_level]
+            z = np.array([_z(level) for level in confidence_level])
+            ci_lower = (mean_return - z * se_return).tolist()
+            ci_upper = (mean_return + z * se_return).tolist()
         
         # 효과 크기 (Cohen's d)
         cohens_d = mean_return / std_return if std_return > 0 else 0
@@ -195,13 +393,14 @@ class StatisticalTester:
             't_statistic': float(t_stat),
             'p_value': float(p_value),
             'p_value_significant': p_value < 0.05,
-            'confidence_interval_lower': float(ci_lower),
-            'confidence_interval_upper': float(ci_upper),
+            'confidence_level': confidence_level,
+            'confidence_interval_lower': ci_lower,
+            'confidence_interval_upper': ci_upper,
             'cohens_d': float(cohens_d),
             'effect_size': self._interpret_cohens_d(cohens_d),
-            'daily_positive_returns': int((daily_returns > 0).sum()),
-            'daily_negative_returns': int((daily_returns < 0).sum()),
-            'daily_neutral_returns': int((daily_returns == 0).sum())
+            'daily_positive_returns': self._wins,
+            'daily_negative_returns': self._losses,
+            'daily_neutral_returns': self._zeros
         }
         
         return profit_stats
@@ -234,30 +433,37 @@ class StatisticalTester:
         returns = self.returns
         
         # 기본 통계
-        mean = returns.mean()
-        median = np.median(returns)
-        mode = stats.mode(returns, keepdims=True).mode[0]
+        mean = self._mean
+        median = self._quantile(50)
+        vals, counts = np.unique(returns, return_counts=True)
+        mode = vals[counts.argmax()]
         
         # 왜도 (Skewness)
-        skewness = stats.skew(returns)
+        skewness = self._skew
         
         # 첨도 (Kurtosis)
-        kurtosis = stats.kurtosis(returns)
+        kurtosis = self._kurt
         
         # 정규성 검정 (Shapiro-Wilk)
         if len(returns) > 5000:
-            # 데이터가 너무 크면 표본 추출
-            sample = np.random.choice(returns, 5000, replace=False)
+            # 데이터가 너무 크면 표본 추출 (인덱스만 비복원 추출 후 gather, 순서 섞기 생략)
+            rng = np.random.default_rng(0)
+            idx = rng.choice(len(returns), 5000, replace=False, shuffle=False)
+            sample = returns[idx].astype(np.float64)
             shapiro_stat, shapiro_p = stats.shapiro(sample)
         else:
             shapiro_stat, shapiro_p = stats.shapiro(returns)
         
-        # 정규성 검정 (Kolmogorov-Smirnov)
-        ks_stat, ks_p = stats.kstest(returns, 'norm', args=(mean, returns.std()))
+        # 정규성 검정 (Kolmogorov-Smirnov), 정렬된 수익률로 D 통계량 직접 계산
+        # 소표본에서는 신뢰할 수 없으므로 생략 (NaN)
+        if self.n_trades >= _MIN_TRADES_KS:
+            ks_stat, ks_p = self._ks_normal()
+        else:
+            ks_stat, ks_p = np.nan, np.nan
         
         # 분위수
-        q1 = np.percentile(returns, 25)
-        q3 = np.percentile(returns, 75)
+        q1 = self._quantile(25)
+        q3 = self._quantile(75)
         iqr = q3 - q1
         
         distribution_stats = {
@@ -281,6 +487,26 @@ class StatisticalTester:
         
         return distribution_stats
     
+    def _ks_normal(self) -> Tuple[float, float]:
+        """
+        정규분포 N(mean, std) 대비 단일 표본 KS 검정 (양측)
+        
+        p-value는 stats.kstest 기본값과 동일하게 n <= 10000이면 정확 분포,
+        그 이상이면 점근 분포(Kolmogorov) 사용
+        """
+        n = self.n_trades
+        cdf = special.ndtr((self._sorted - self._mean) / self._std)
+        ecdf_hi = np.arange(1, n + 1) / n
+        d_plus = (ecdf_hi - cdf).max()
+        d_minus = (cdf - (ecdf_hi - 1 / n)).max()
+        d = max(d_plus, d_minus)
+        
+        if n <= 10000:
+            p = stats.kstwo.sf(d, n)
+        else:
+            p = special.kolmogorov(d * math.sqrt(n))
+        return float(d), float(np.clip(p, 0, 1))
+    
     @staticmethod
     def _interpret_skewness(skewness: float) -> str:
         """왜도 해석"""
@@ -304,6 +530,9 @@ class StatisticalTester:
     @staticmethod
     def _assess_normality(shapiro_p: float, ks_p: float) -> str:
         """정규성 평가"""
+        if np.isnan(ks_p):
+            # KS 검정 생략 시 Shapiro-Wilk 결과만으로 판정
+            return "정규분포 (Shapiro-Wilk 통과)" if shapiro_p > 0.05 else "정규분포 아님"
         if shapiro_p > 0.05 and ks_p > 0.05:
             return "정규분포 (양쪽 검정 통과)"
         elif shapiro_p > 0.05 or ks_p > 0.05:
@@ -328,25 +557,33 @@ class StatisticalTester:
         dict
             꼬리 리스크 통계
         """
-        returns = self.returns
-        losses = returns[returns < 0]
+        losses = self._sorted[:self._losses]  # 음수 수익률은 정렬 배열의 앞부분
         
         # VaR (Value at Risk)
         var_percentile = 1 - confidence_level
-        var_95 = np.percentile(returns, var_percentile * 100)
-        
-        # CVaR (Conditional VaR, Expected Shortfall)
-        cvar_95 = losses[losses <= var_95].mean() if len(losses[losses <= var_95]) > 0 else losses.mean()
+        var_95 = self._quantile(var_percentile * 100)
+        
+        # 정렬 배열에서 분위수 경계까지의 구간 (마스크 배열 없이 슬라이스로 조회)
+        sorted_returns = self._sorted
+        worst_10_pct = self._quantile(10)
+        best_10_pct = self._quantile(90)
+        k_var, k_worst = np.searchsorted(sorted_returns, [var_95, worst_10_pct], side='right')
+        k_best = np.searchsorted(sorted_returns, best_10_pct, side='left')
+        
+        # CVaR (Conditional VaR, Expected Shortfall): VaR 이하 손실 거래의 평균
+        k_cvar = min(k_var, self._losses)
+        if k_cvar > 0:
+            cvar_95 = sorted_returns[:k_cvar].mean()
+        else:
+            cvar_95 = losses.mean() if self._losses > 0 else 0.0  # 손실 거래 없음
         
         # 극단 손실 통계
-        worst_10_pct = np.percentile(returns, 10)
-        worst_trades = returns[returns <= worst_10_pct]
-        
-        best_10_pct = np.percentile(returns, 90)
-        best_trades = returns[returns >= best_10_pct]
+        worst_trades = sorted_returns[:k_worst]
+        best_trades = sorted_returns[k_best:]
         
-        # Fat Tail 분석
-        extreme_losses = losses[losses < returns.mean() - 2 * returns.std()]
+        # Fat Tail 분석: (평균 - 2σ) 미만 손실 = 정렬 배열의 앞부분
+        k_extreme = min(np.searchsorted(sorted_returns, self._mean - 2 * self._std, side='left'), self._losses)
+        extreme_losses = sorted_returns[:k_extreme]
         
         tail_risk_stats = {
             'var_95': float(var_95),
@@ -359,31 +596,139 @@ class StatisticalTester:
             'best_10_pct_count': len(best_trades),
             'extreme_loss_count': len(extreme_losses),
             'extreme_loss_avg': float(extreme_losses.mean()) if len(extreme_losses) > 0 else 0,
-            'largest_loss': float(returns.min()),
-            'loss_frequency': float((returns < 0).sum() / len(returns)),
+            'largest_loss': float(self._min),
+            'loss_frequency': float(self._losses / self.n_trades),
             'fat_tail_ratio': float(len(extreme_losses) / len(losses)) if len(losses) > 0 else 0
         }
         
         return tail_risk_stats
     
     # ========== 모든 검정 통합 실행 ==========
-    def run_all(self) -> Dict[str, Any]:
+    def run_all(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         통계 검정 4개 항목 모두 실행
         
+        Parameters:
+        -----------
+        max_workers : int, optional
+            지정 시 각 검정을 스레드 풀에서 병렬 실행 (기본값: 순차 실행)
+        
         Returns:
         --------
         dict
             모든 검정 결과
         """
-        results = {
-            '2-1_win_rate': self.test_win_rate_confidence(),
-            '2-2_profit': self.test_profit_significance(),
-            '2-3_distribution': self.analyze_distribution(),
-            '2-4_tail_risk': self.analyze_tail_risk()
-        }
+        tasks = [
+            ('2-1_win_rate', 'test_win_rate_confidence'),
+            ('2-2_profit', 'test_profit_significance'),
+            ('2-3_distribution', 'analyze_distribution'),
+            ('2-4_tail_risk', 'analyze_tail_risk')
+        ]
+        
+        # 표본이 너무 작으면 검정 자체가 무의미 → 조기 반환
+        if self.n_trades < _MIN_TRADES:
+            return {'error': f'거래 수 부족 (최소 {_MIN_TRADES}건 필요)', 'n_trades': self.n_trades}
+        
+        if max_workers:
+            # 요약 통계는 __init__에서 공유 캐시로 계산됨 → 각 검정은 읽기 전용으로 독립적
+            # (shapiro/ndtr 등 NumPy/SciPy C 루틴은 GIL을 해제하므로 스레드로 충분)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {name: executor.submit(getattr(self, method)) for name, method in tasks}
+                return {name: future.result() for name, future in futures.items()}
+        
+        results = {name: getattr(self, method)() for name, method in tasks}
         
         return results
+    
+    @classmethod
+    def run_all_batch(cls, returns_list, confidence_level: float = 0.95) -> Dict[str, Any]:
+        """
+        여러 전략(거래 수 동일)의 핵심 통계를 한 번에 계산
+        
+        전략 × 거래 2차원 배열로 쌓아 적률/정렬/분위수/이항 검정을 축 단위 연산으로 처리
+        (Walk-forward, Monte Carlo 등 반복 호출 시 전략별 Python 오버헤드 제거)
+        Shapiro-Wilk만 전략별로 개별 실행
+        
+        Parameters:
+        -----------
+        returns_list : sequence of array-like
+            전략별 수익률(%) 배열 목록 (모두 같은 길이)
+        confidence_level : float
+            신뢰 수준 (기본값: 95%)
+        
+        Returns:
+        --------
+        dict
+            항목별 (전략 수,) 배열
+        """
+        returns = np.stack([np.asarray(r, dtype=np.float64) for r in returns_list])
+        n_strategies, n = returns.shape
+        if n < _MIN_TRADES:
+            return {'error': f'거래 수 부족 (최소 {_MIN_TRADES}건 필요)', 'n_trades': n}
+        
+        sorted_returns = np.sort(returns, axis=1)
+        
+        # 적률 (scipy skew/kurtosis bias=True 기준)
+        means = returns.mean(axis=1)
+        dev = returns - means[:, None]
+        dev2 = dev * dev
+        m2 = dev2.sum(axis=1)
+        m3 = (dev2 * dev).sum(axis=1)
+        m4 = (dev2 * dev2).sum(axis=1)
+        var = m2 / n
+        stds = np.sqrt(var)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            skewness = (m3 / n) / (var * stds)
+            kurtosis = (m4 / n) / (var * var) - 3
+            t_stat = means / np.sqrt(m2 / (n - 1) / n)
+        profit_p = 2 * t.sf(np.abs(t_stat), n - 1)
+        
+        # 승/패/무 및 이항 검정 (p = 0.5, 양측)
+        wins = np.count_nonzero(returns > 0, axis=1)
+        zeros = np.count_nonzero(returns == 0, axis=1)
+        losses = n - wins - zeros
+        win_p = np.minimum(1.0, 2 * np.minimum(bdtrc(wins - 1, n, 0.5), bdtr(wins, n, 0.5)))
+        ci_lower, ci_upper = cls._wilson_ci(wins, n, confidence_level)
+        
+        # VaR / CVaR (VaR 이하 손실 거래 평균, 없으면 전체 손실 평균)
+        var_95 = _sorted_quantile(sorted_returns, (1 - confidence_level) * 100)
+        neg = sorted_returns < 0
+        tail = neg & (sorted_returns <= var_95[:, None])
+        tail_count = tail.sum(axis=1)
+        loss_mean = np.where(neg, sorted_returns, 0.0).sum(axis=1) / np.maximum(losses, 1)
+        cvar_95 = np.where(
+            tail_count > 0,
+            np.where(tail, sorted_returns, 0.0).sum(axis=1) / np.maximum(tail_count, 1),
+            loss_mean
+        )
+        
+        # 정규성 (Shapiro-Wilk): 벡터화 불가 → 전략별, 대표본은 공통 인덱스로 표본 추출
+        if n > 5000:
+            idx = np.random.default_rng(0).choice(n, 5000, replace=False, shuffle=False)
+            shapiro_input = returns[:, idx]
+        else:
+            shapiro_input = returns
+        shapiro_p = np.array([stats.shapiro(row)[1] for row in shapiro_input])
+        
+        return {
+            'n_strategies': n_strategies,
+            'n_trades': n,
+            'win_rate': wins / n,
+            'win_rate_p_value': win_p,
+            'win_rate_ci_lower': ci_lower,
+            'win_rate_ci_upper': ci_upper,
+            'mean_return': means,
+            'std_return': stds,
+            't_statistic': t_stat,
+            'profit_p_value': profit_p,
+            'skewness': skewness,
+            'kurtosis': kurtosis,
+            'shapiro_wilk_p': shapiro_p,
+            'var_95': var_95,
+            'cvar_95': cvar_95,
+            'largest_loss': sorted_returns[:, 0],
+            'loss_frequency': losses / n
+        }
 
 
 # 테스트 코드
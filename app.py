@@ -546,6 +546,11 @@ class EnhancedDashboard:
                 
                 v16_status = "✅ 완료" if st.session_state.validators_16_report else "❌ 미완료"
                 st.markdown(f"**16개 검증**: {v16_status}")
+            
+            st.markdown("---")
+            
+            # 오류 발생 시 Traceback 표시 여부 (디버깅용)
+            st.checkbox("🐞 오류 상세 표시 (Traceback)", key="show_tracebacks")
     
     def render_header(self):
         """헤더 렌더링"""
@@ -732,7 +737,13 @@ class EnhancedDashboard:
                                         'return_pct', 'runup_pct', 'drawdown_pct']].tail(20).copy()
                     display_df.columns = ['거래번호', '방향', '진입날짜', '청산날짜', 
                                           '수익률%', '런업%', '드로다운%']
-                    st.dataframe(display_df, use_container_width=True, height=400)
+                    st.dataframe(
+                        display_df, use_container_width=True, height=400,
+                        column_config={
+                            '진입날짜': st.column_config.DateColumn(format="YYYY-MM-DD"),
+                            '청산날짜': st.column_config.DateColumn(format="YYYY-MM-DD")
+                        }
+                    )
                 
             except Exception as e:
                 st.error(f"❌ CSV 로딩 실패: {str(e)}")
@@ -1073,8 +1084,9 @@ class EnhancedDashboard:
                     st.session_state.qs_metrics = None
                 except Exception as e:
                     st.error(f"❌ Quantstats 분석 실패: {e}")
-                    import traceback
-                    st.code(traceback.format_exc())
+                    if st.session_state.get('show_tracebacks', False):
+                        import traceback
+                        st.code(traceback.format_exc())
                     st.session_state.qs_metrics = None
         
         # 결과 표시
@@ -21,9 +21,355 @@ Phoenix Strategy Analyzer - 16개 검증 시스템 (완벽 완성본)
 import streamlit as st
 import pandas as pd
 import numpy as np
-import json
 import plotly.graph_objects as go
+import gzip
+import html
+import traceback
+import uuid
 from datetime import datetime
+from typing import Final
+
+
+# st.fragment (Streamlit 1.33+) 미지원 버전에서는 일반 함수로 동작
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+# 16개 검증 소개 박스 (정적 HTML)
+_INTRO_HTML: Final[str] = """
+<div style="background: linear-gradient(120deg, #1e3a8a 0%, #2563eb 100%); 
+            padding: 1.5rem; border-radius: 10px; margin-bottom: 1.5rem;">
+    <p style="color: #ffffff; font-size: 1rem; line-height: 1.7; margin: 0;">
+        <strong style="font-size: 1.1rem;">🔬 16개 종합 검증이란?</strong><br><br>
+        Walk-Forward 검증을 넘어 <strong>체계적인 통계 분석</strong>을 통해<br>
+        전략의 안정성, 신뢰도, 실전 생존성을 <strong>16개 차원</strong>에서 검증합니다.<br><br>
+        • <strong>시계열 분석</strong> (5개): 월별/거래 연속성/보유기간<br>
+        • <strong>통계 검정</strong> (4개): 승률 신뢰도/수익성/분포/꼬리 리스크<br>
+        • <strong>거래 분석</strong> (2개): 승/패 비교/특성 분류<br>
+        • <strong>극한 상황</strong> (5개): 50달러 생존성/부트스트랩/극단값<br>
+        • <strong>포지션 최적화</strong> (3개): Sharpe/Kelly/동적 로트<br>
+        • <strong>고급 통계</strong> (3개): 기울기/자기상관/이분산성<br>
+        • <strong>종합평가</strong> (1개): 최종 판정 및 GO/NO-GO
+    </p>
+</div>
+"""
+
+# 16개 검증 시스템 구조 테이블 (정적 HTML)
+_STRUCTURE_TABLE_HTML: Final[str] = """
+<div style="color: #ffffff; font-size: 0.95rem; line-height: 1.6;">
+
+<table style="width:100%; border-collapse: collapse;">
+<tr>
+<td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
+<strong>1️⃣ 시계열 분석 (5개)</strong><br>
+- 월별 수익률 분석<br>
+- 연속 손실 거래<br>
+- 보유기간 분포<br>
+- 월간 회귀선<br>
+- 월간 일관성
+</td>
+<td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
+<strong>2️⃣ 통계 검정 (4개)</strong><br>
+- 승률 신뢰도<br>
+- 수익률 유의성<br>
+- 분포 분석<br>
+- 꼬리 리스크
+</td>
+<td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
+<strong>3️⃣ 거래 분석 (2개)</strong><br>
+- 승/패 거래 비교<br>
+- 거래 특성 분류
+</td>
+<td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
+<strong>4️⃣ 극한 상황 (5개)</strong><br>
+- 50달러 생존성<br>
+- 부트스트랩<br>
+- 극단값 분석<br>
+- 자본 성장<br>
+- 회귀선 분석
+</td>
+</tr>
+<tr>
+<td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
+<strong>5️⃣ 포지션 최적화 (3개)</strong><br>
+- Sharpe/Sortino/Calmar<br>
+- Kelly Criterion<br>
+- 동적 로트
+</td>
+<td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
+<strong>6️⃣ 고급 통계 (3개)</strong><br>
+- 기울기 검정<br>
+- 자기상관 검정<br>
+- 이분산성 검정
+</td>
+<td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
+<strong>7️⃣ 종합평가 (1개)</strong><br>
+- 배제 조건<br>
+- 최종 점수<br>
+- GO/NO-GO 판정
+</td>
+<td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
+</td>
+</tr>
+</table>
+
+</div>
+"""
+
+# 카테고리별 점수 차트 레이아웃 (데이터와 무관한 고정 설정)
+_SCORES_LAYOUT = dict(
+    title=dict(
+        text='<b>16개 검증 카테고리별 점수</b>',
+        font=dict(size=18, color='#ffffff')
+    ),
+    xaxis=dict(
+        title='점수',
+        title_font=dict(size=14, color='#e2e8f0'),
+        tickfont=dict(size=12, color='#cbd5e1'),
+        gridcolor='#334155',
+        zeroline=False,
+        range=[0, 105]
+    ),
+    yaxis=dict(
+        title='',
+        tickfont=dict(size=12, color='#e2e8f0'),
+    ),
+    plot_bgcolor='#0f172a',
+    paper_bgcolor='#0f172a',
+    margin=dict(l=200, r=100, t=80, b=60),
+    height=500,
+    hovermode='closest'
+)
+
+
+# 거래 목록 표시 컬럼
+_DISPLAY_COLS = ['trade_num', 'direction', 'entry_date', 'exit_date', 'return_pct', 'holding_days']
+_COL_MAP = {
+    'trade_num': '거래번호',
+    'direction': '방향',
+    'entry_date': '진입날짜',
+    'exit_date': '청산날짜',
+    'return_pct': '수익률%',
+    'holding_days': '보유일수'
+}
+_TRADES_PAGE_SIZE = 500
+
+
+def _trades_view(trades: pd.DataFrame) -> tuple[bytes, pd.DataFrame | None]:
+    """
+    거래 데이터 해시 키와 거래 목록 표시용 데이터프레임
+
+    CSV 로드로 trades 객체가 바뀔 때만 한 번 계산해 session_state에 보관
+    (재실행마다 해시/복사/역직렬화 없이 같은 객체를 재사용)
+    """
+    cached = st.session_state.get('_trades_view')
+    if cached is None or cached['trades'] is not trades:
+        cached = {
+            'trades': trades,
+            'key': pd.util.hash_pandas_object(trades, index=False).values.tobytes(),
+            'display': trades[_DISPLAY_COLS].rename(columns=_COL_MAP) if len(trades) > 0 else None
+        }
+        st.session_state['_trades_view'] = cached
+    return cached['key'], cached['display']
+
+
+def _metrics_grid(pairs: list[tuple[str, str]], columns: int = 4) -> str:
+    """
+    (라벨, 값) 목록을 하나의 CSS 그리드 HTML로 렌더링
+
+    st.metric을 여러 번 호출하는 대신 한 번의 st.markdown으로 출력
+    """
+    cells = "".join(
+        f'<div style="padding: 0.5rem 0;">'
+        f'<div style="color: #9ca3af; font-size: 0.875rem;">{html.escape(str(label))}</div>'
+        f'<div style="color: #ffffff; font-size: 1.75rem; line-height: 1.4;">{html.escape(str(value))}</div>'
+        f'</div>'
+        for label, value in pairs
+    )
+    return (
+        f'<div style="display: grid; grid-template-columns: repeat({columns}, 1fr); '
+        f'gap: 1rem; margin-bottom: 1rem;">{cells}</div>'
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _build_html_report(report_key: str, _report: dict) -> bytes:
+    """
+    검증 결과 HTML 리포트 생성 (report_key 기준 캐시, gzip 압축 bytes)
+    """
+    disq = _report['disqualification']
+    final_score = _report['final_score']
+    
+    html_content = f"""
+    <html>
+    <head>
+    <meta charset="utf-8">
+    <style>
+    body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
+    h1 {{ color: #1f2937; border-bottom: 3px solid #3b82f6; padding-bottom: 10px; }}
+    h2 {{ color: #374151; margin-top: 20px; }}
+    table {{ width: 100%; border-collapse: collapse; background: white; margin: 15px 0; }}
+    th, td {{ border: 1px solid #d1d5db; padding: 12px; text-align: left; }}
+    th {{ background-color: #3b82f6; color: white; font-weight: bold; }}
+    tr:nth-child(even) {{ background-color: #f9fafb; }}
+    .status-go {{ color: #10b981; font-weight: bold; }}
+    .status-nogo {{ color: #ef4444; font-weight: bold; }}
+    .score {{ text-align: right; font-weight: bold; }}
+    </style>
+    </head>
+    <body>
+    
+    <h1>🔬 16개 검증 시스템 분석 결과</h1>
+    
+    <h2>🎯 자동매매 판정</h2>
+    <p>상태: <span class="status-{('go' if disq['status'] == '✅ GO' else 'nogo')}">{disq['status']}</span></p>
+    <p>기준: {disq['tier']}</p>
+    <p>이유:</p>
+    <ul>
+    """
+    
+    if disq['reasons']:
+        for reason in disq['reasons']:
+            html_content += f"<li>{reason}</li>"
+    else:
+        html_content += "<li>모든 검증 통과</li>"
+    
+    html_content += f"""
+    </ul>
+    
+    <h2>📈 카테고리별 점수</h2>
+    <table>
+    <tr>
+    <th>카테고리</th>
+    <th>점수</th>
+    </tr>
+    """
+    
+    for category, score in final_score['scores'].items():
+        html_content += f"<tr><td>{category}</td><td class='score'>{score:.1f}점</td></tr>"
+    
+    html_content += f"""
+    </table>
+    
+    <h2>📊 종합 평가</h2>
+    <p><strong>최종 점수:</strong> {final_score['final_score']:.1f}점</p>
+    <p><strong>등급:</strong> {final_score['rating']}</p>
+    <p><strong>판정:</strong> {disq['status']}</p>
+    
+    </body>
+    </html>
+    """
+    
+    return gzip.compress(html_content.encode('utf-8'), compresslevel=6)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _build_json_report(report_key: str, _report: dict) -> bytes:
+    """
+    검증 결과 JSON 리포트 생성 (report_key 기준 캐시, gzip 압축 bytes)
+
+    orjson: numpy 값 직접 직렬화, UTF-8 기본
+    """
+    import orjson
+    json_bytes = orjson.dumps(
+        _report,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        default=str
+    )
+    return gzip.compress(json_bytes, compresslevel=6)
+
+
+@_fragment
+def _render_results(report: dict, run_id: str):
+    """
+    16개 검증 결과 표시 (요약/판정/차트/다운로드)
+    
+    run_id는 검증 실행마다 새로 발급 → 다운로드 리포트 캐시 키
+    """
+    # 결과 표시
+    st.success("✅ 16개 검증 완료!")
+    
+    st.markdown("---")
+    st.markdown("### 📊 검증 결과 요약")
+    
+    # 메트릭 표시
+    disq = report['disqualification']
+    final_score = report['final_score']
+    
+    st.markdown(_metrics_grid([
+        ("승률", f"{disq.get('win_rate', 0):.1f}%"),
+        ("최종 점수", f"{final_score['final_score']:.1f}점"),
+        ("등급", final_score['rating']),
+        ("판정", disq['status']),
+    ]), unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # 최종 판정
+    st.markdown("### 🎯 자동매매 판정")
+    
+    status = disq['status']
+    
+    # 상태 문자열 첫 글자(이모지)로 표시 방식 결정
+    status_dispatch = {"❌": st.error, "⚠": st.warning}
+    show_status = status_dispatch.get(status.lstrip()[:1], st.success)
+    show_status(status)
+    
+    if show_status is st.error and disq['reasons']:
+        st.error("**이유:**\n" + "\n".join([f"- {r}" for r in disq['reasons']]))
+    
+    st.markdown("---")
+    
+    # 카테고리별 점수 - Plotly 가로 바 차트 (드로우다운 수정 적용!)
+    st.markdown("### 📈 카테고리별 점수")
+    
+    categories = list(final_score['scores'].keys())
+    values = list(final_score['scores'].values())
+    
+    # ========== Plotly 가로 바 차트 ==========
+    fig = go.Figure(data=[
+        go.Bar(
+            y=categories,
+            x=values,
+            orientation='h',
+            marker=dict(
+                color=values,
+                colorscale='RdYlGn',
+                showscale=False,
+                line=dict(color='#ffffff', width=1)
+            ),
+            text=[f"{v:.1f}" for v in values],
+            textposition='outside',
+            hovertemplate='<b>%{y}</b><br>점수: %{x:.1f}<extra></extra>'
+        )
+    ])
+    
+    fig.update_layout(**_SCORES_LAYOUT)
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("---")
+
+    # 결과 다운로드 (HTML)
+    st.markdown("### 📥 결과 다운로드")
+    
+    # 리포트는 검증 실행 단위로 캐시 (부트스트랩 등 난수 결과가 실행마다 달라지므로
+    # 거래 데이터/점수만으로는 키가 될 수 없음)
+    html_gz = _build_html_report(run_id, report)
+    
+    st.download_button(
+        label="📄 검증 결과 HTML(gz) 다운로드",
+        data=html_gz,
+        file_name=f"validation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html.gz",
+        mime="application/gzip"
+    )
+    
+    # JSON도 다운로드
+    json_gz = _build_json_report(run_id, report)
+    st.download_button(
+        label="📊 검증 결과 JSON(gz) 다운로드",
+        data=json_gz,
+        file_name=f"validation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json.gz",
+        mime="application/gzip"
+    )
 
 
 def render_page_16_validators(converter_instance):
@@ -33,159 +379,19 @@ def render_page_16_validators(converter_instance):
     st.header("🔬 16개 종합 검증 시스템")
     
     # ========== 소개 박스 (항상 표시!) ==========
-    st.markdown("""
-    <div style="background: linear-gradient(120deg, #1e3a8a 0%, #2563eb 100%); 
-                padding: 1.5rem; border-radius: 10px; margin-bottom: 1.5rem;">
-        <p style="color: #ffffff; font-size: 1rem; line-height: 1.7; margin: 0;">
-            <strong style="font-size: 1.1rem;">🔬 16개 종합 검증이란?</strong><br><br>
-            Walk-Forward 검증을 넘어 <strong>체계적인 통계 분석</strong>을 통해<br>
-            전략의 안정성, 신뢰도, 실전 생존성을 <strong>16개 차원</strong>에서 검증합니다.<br><br>
-            • <strong>시계열 분석</strong> (5개): 월별/거래 연속성/보유기간<br>
-            • <strong>통계 검정</strong> (4개): 승률 신뢰도/수익성/분포/꼬리 리스크<br>
-            • <strong>거래 분석</strong> (2개): 승/패 비교/특성 분류<br>
-            • <strong>극한 상황</strong> (5개): 50달러 생존성/부트스트랩/극단값<br>
-            • <strong>포지션 최적화</strong> (3개): Sharpe/Kelly/동적 로트<br>
-            • <strong>고급 통계</strong> (3개): 기울기/자기상관/이분산성<br>
-            • <strong>종합평가</strong> (1개): 최종 판정 및 GO/NO-GO
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_INTRO_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
+    # ========== 16개 검증 시스템 구조 (CSV 업로드 후에는 접어서 표시) ==========
+    with st.expander("ℹ️ 16개 검증 시스템 구조", expanded=(converter_instance is None)):
+        st.markdown(_STRUCTURE_TABLE_HTML, unsafe_allow_html=True)
+    
     # CSV 없으면 여기서 중단
     if converter_instance is None:
         st.warning("⚠️ 먼저 CSV를 업로드하세요.")
-        
-        # ========== 16개 검증 시스템 구조 (항상 표시!) ==========
-        st.markdown("""
-        <div style="color: #ffffff; font-size: 0.95rem; line-height: 1.6;">
-        
-        **ℹ️ 16개 검증 시스템 구조**
-        
-        <table style="width:100%; border-collapse: collapse;">
-        <tr>
-        <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-        <strong>1️⃣ 시계열 분석 (5개)</strong><br>
-        • 월별 수익률 분석<br>
-        • 연속 손실 거래<br>
-        • 보유기간 분포<br>
-        • 월간 회귀선<br>
-        • 월간 일관성
-        </td>
-        <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-        <strong>2️⃣ 통계 검정 (4개)</strong><br>
-        • 승률 신뢰도<br>
-        • 수익률 유의성<br>
-        • 분포 분석<br>
-        • 꼬리 리스크
-        </td>
-        <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-        <strong>3️⃣ 거래 분석 (2개)</strong><br>
-        • 승/패 거래 비교<br>
-        • 거래 특성 분류
-        </td>
-        <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-        <strong>4️⃣ 극한 상황 (5개)</strong><br>
-        • 50달러 생존성<br>
-        • 부트스트랩<br>
-        • 극단값 분석<br>
-        • 자본 성장<br>
-        • 회귀선 분석
-        </td>
-        </tr>
-        <tr>
-        <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-        <strong>5️⃣ 포지션 최적화 (3개)</strong><br>
-        • Sharpe/Sortino/Calmar<br>
-        • Kelly Criterion<br>
-        • 동적 로트
-        </td>
-        <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-        <strong>6️⃣ 고급 통계 (3개)</strong><br>
-        • 기울기 검정<br>
-        • 자기상관 검정<br>
-        • 이분산성 검정
-        </td>
-        <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-        <strong>7️⃣ 종합평가 (1개)</strong><br>
-        • 배제 조건<br>
-        • 최종 점수<br>
-        • GO/NO-GO 판정
-        </td>
-        <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-        </td>
-        </tr>
-        </table>
-        
-        </div>
-        """, unsafe_allow_html=True)
         return
     
-    # ========== 16개 검증 시스템 구조 (처음부터 표시!) ==========
-    st.markdown("""
-    <div style="color: #ffffff; font-size: 0.95rem; line-height: 1.6;">
-    
-    <p style="font-size: 1.1rem; font-weight: 700; margin-bottom: 1rem;">ℹ️ 16개 검증 시스템 구조</p>
-    
-    <table style="width:100%; border-collapse: collapse;">
-    <tr>
-    <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-    <strong>1️⃣ 시계열 분석 (5개)</strong><br>
-    - 월별 수익률 분석<br>
-    - 연속 손실 거래<br>
-    - 보유기간 분포<br>
-    - 월간 회귀선<br>
-    - 월간 일관성
-    </td>
-    <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-    <strong>2️⃣ 통계 검정 (4개)</strong><br>
-    - 승률 신뢰도<br>
-    - 수익률 유의성<br>
-    - 분포 분석<br>
-    - 꼬리 리스크
-    </td>
-    <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-    <strong>3️⃣ 거래 분석 (2개)</strong><br>
-    - 승/패 거래 비교<br>
-    - 거래 특성 분류
-    </td>
-    <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-    <strong>4️⃣ 극한 상황 (5개)</strong><br>
-    - 50달러 생존성<br>
-    - 부트스트랩<br>
-    - 극단값 분석<br>
-    - 자본 성장<br>
-    - 회귀선 분석
-    </td>
-    </tr>
-    <tr>
-    <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-    <strong>5️⃣ 포지션 최적화 (3개)</strong><br>
-    - Sharpe/Sortino/Calmar<br>
-    - Kelly Criterion<br>
-    - 동적 로트
-    </td>
-    <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-    <strong>6️⃣ 고급 통계 (3개)</strong><br>
-    - 기울기 검정<br>
-    - 자기상관 검정<br>
-    - 이분산성 검정
-    </td>
-    <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-    <strong>7️⃣ 종합평가 (1개)</strong><br>
-    - 배제 조건<br>
-    - 최종 점수<br>
-    - GO/NO-GO 판정
-    </td>
-    <td style="border: 1px solid #374151; padding: 12px; background: #1e2330;">
-    </td>
-    </tr>
-    </table>
-    
-    </div>
-    """, unsafe_allow_html=True)
-    
     st.markdown("---")
     
     # 기본 통계 표시
@@ -193,38 +399,26 @@ def render_page_16_validators(converter_instance):
         stats = converter_instance.get_statistics()
         
         st.markdown("### 📊 기본 통계")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("총 거래", f"{stats['total_trades']}건")
-        
-        with col2:
-            st.metric("승률", f"{stats['win_rate']:.2f}%")
-        
-        with col3:
-            st.metric("총 수익률", f"{stats['total_return']:.2f}%")
-        
-        with col4:
-            st.metric("기간", f"{stats['period_days']}일")
+        st.markdown(_metrics_grid([
+            ("총 거래", f"{stats['total_trades']}건"),
+            ("승률", f"{stats['win_rate']:.2f}%"),
+            ("총 수익률", f"{stats['total_return']:.2f}%"),
+            ("기간", f"{stats['period_days']}일"),
+        ]), unsafe_allow_html=True)
         
         st.markdown("---")
         
         # 상세 통계
         st.markdown("### 📈 상세 통계")
         
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("수익 거래", f"{stats['winning_trades']}건")
-            st.metric("평균 수익", f"{stats['avg_win']:.2f}%")
-        
-        with col2:
-            st.metric("손실 거래", f"{stats['losing_trades']}건")
-            st.metric("평균 손실", f"{stats['avg_loss']:.2f}%")
-        
-        with col3:
-            st.metric("최대 낙폭", f"{stats['max_drawdown']:.2f}%")
-            st.metric("평균 거래 수익", f"{stats['avg_return']:.2f}%")
+        st.markdown(_metrics_grid([
+            ("수익 거래", f"{stats['winning_trades']}건"),
+            ("손실 거래", f"{stats['losing_trades']}건"),
+            ("최대 낙폭", f"{stats['max_drawdown']:.2f}%"),
+            ("평균 수익", f"{stats['avg_win']:.2f}%"),
+            ("평균 손실", f"{stats['avg_loss']:.2f}%"),
+            ("평균 거래 수익", f"{stats['avg_return']:.2f}%"),
+        ], columns=3), unsafe_allow_html=True)
         
         st.markdown("---")
         
@@ -232,12 +426,26 @@ def render_page_16_validators(converter_instance):
         st.markdown("### 📋 거래 목록")
         
         trades = converter_instance.trades
+        trades_key, display_trades = _trades_view(trades)
         if len(trades) > 0:
-            display_cols = ['trade_num', 'direction', 'entry_date', 'exit_date', 'return_pct', 'holding_days']
-            display_trades = trades[display_cols].copy()
-            display_trades.columns = ['거래번호', '방향', '진입날짜', '청산날짜', '수익률%', '보유일수']
+            # 거래가 많으면 페이지 단위로 표시
+            if len(display_trades) > _TRADES_PAGE_SIZE:
+                n_pages = (len(display_trades) - 1) // _TRADES_PAGE_SIZE + 1
+                page = st.number_input(
+                    f"페이지 (총 {n_pages}쪽, {len(display_trades)}건)",
+                    min_value=1, max_value=n_pages, value=1, step=1,
+                    key="trades_page"
+                )
+                start = (int(page) - 1) * _TRADES_PAGE_SIZE
+                display_trades = display_trades.iloc[start:start + _TRADES_PAGE_SIZE]
             
-            st.dataframe(display_trades, use_container_width=True, height=400)
+            st.dataframe(
+                display_trades, use_container_width=True, height=400,
+                column_config={
+                    '진입날짜': st.column_config.DateColumn(format="YYYY-MM-DD"),
+                    '청산날짜': st.column_config.DateColumn(format="YYYY-MM-DD")
+                }
+            )
         
         st.markdown("---")
         
@@ -249,11 +457,13 @@ def render_page_16_validators(converter_instance):
                 try:
                     from analysis.validators.comprehensive import ComprehensiveEvaluator
                     
-                    # ComprehensiveEvaluator 실행
+                    # ComprehensiveEvaluator 실행 (날짜 컬럼은 로드 시 datetime64로 변환됨)
+                    start_ts = trades['entry_date'].min()
+                    end_ts = trades['exit_date'].max()
                     evaluator = ComprehensiveEvaluator(
-                        converter_instance.trades,
-                        pd.Timestamp(converter_instance.trades['entry_date'].min()),
-                        pd.Timestamp(converter_instance.trades['exit_date'].max()),
+                        trades,
+                        start_ts,
+                        end_ts,
                         initial_capital=50.0
                     )
                     
@@ -264,194 +474,11 @@ def render_page_16_validators(converter_instance):
                     
                     # 종합 리포트 생성
                     report = evaluator.get_comprehensive_report()
-                    all_results = report['validators']
-                    
-                    # 결과 표시
-                    st.success("✅ 16개 검증 완료!")
-                    
-                    st.markdown("---")
-                    st.markdown("### 📊 검증 결과 요약")
-                    
-                    # 메트릭 표시
-                    col1, col2, col3, col4 = st.columns(4)
                     
-                    disq = report['disqualification']
-                    final_score = report['final_score']
-                    
-                    with col1:
-                        st.metric(
-                            "승률", 
-                            f"{disq.get('win_rate', 0):.1f}%"
-                        )
-                    
-                    with col2:
-                        st.metric(
-                            "최종 점수", 
-                            f"{final_score['final_score']:.1f}점"
-                        )
-                    
-                    with col3:
-                        st.metric(
-                            "등급", 
-                            final_score['rating']
-                        )
-                    
-                    with col4:
-                        st.metric(
-                            "판정", 
-                            disq['status']
-                        )
-                    
-                    st.markdown("---")
-                    
-                    # 최종 판정
-                    st.markdown("### 🎯 자동매매 판정")
-                    
-                    status = disq['status']
-                    
-                    if "❌" in status:
-                        st.error(status)
-                        if disq['reasons']:
-                            st.error("**이유:**\n" + "\n".join([f"- {r}" for r in disq['reasons']]))
-                    elif "⚠️" in status:
-                        st.warning(status)
-                    else:
-                        st.success(status)
-                    
-                    st.markdown("---")
-                    
-                    # 카테고리별 점수 - Plotly 가로 바 차트 (드로우다운 수정 적용!)
-                    st.markdown("### 📈 카테고리별 점수")
-                    
-                    scores_df = pd.DataFrame(
-                        list(final_score['scores'].items()),
-                        columns=['카테고리', '점수']
-                    )
-                    
-                    # ========== Plotly 가로 바 차트 ==========
-                    fig = go.Figure(data=[
-                        go.Bar(
-                            y=scores_df['카테고리'],
-                            x=scores_df['점수'],
-                            orientation='h',
-                            marker=dict(
-                                color=scores_df['점수'],
-                                colorscale='RdYlGn',
-                                showscale=False,
-                                line=dict(color='#ffffff', width=1)
-                            ),
-                            text=scores_df['점수'].round(1),
-                            textposition='outside',
-                            hovertemplate='<b>%{y}</b><br>점수: %{x:.1f}<extra></extra>'
-                        )
-                    ])
-                    
-                    fig.update_layout(
-                        title=dict(
-                            text='<b>16개 검증 카테고리별 점수</b>',
-                            font=dict(size=18, color='#ffffff')
-                        ),
-                        xaxis=dict(
-                            title='점수',
-                            title_font=dict(size=14, color='#e2e8f0'),
-                            tickfont=dict(size=12, color='#cbd5e1'),
-                            gridcolor='#334155',
-                            zeroline=False,
-                            range=[0, 105]
-                        ),
-                        yaxis=dict(
-                            title='',
-                            tickfont=dict(size=12, color='#e2e8f0'),
-                        ),
-                        plot_bgcolor='#0f172a',
-                        paper_bgcolor='#0f172a',
-                        margin=dict(l=200, r=100, t=80, b=60),
-                        height=500,
-                        hovermode='closest'
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    st.markdown("---")
-
-                    # 결과 다운로드 (HTML)
-                    st.markdown("### 📥 결과 다운로드")
-                    
-                    html_content = f"""
-                    <html>
-                    <head>
-                    <meta charset="utf-8">
-                    <style>
-                    body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
-                    h1 {{ color: #1f2937; border-bottom: 3px solid #3b82f6; padding-bottom: 10px; }}
-                    h2 {{ color: #374151; margin-top: 20px; }}
-                    table {{ width: 100%; border-collapse: collapse; background: white; margin: 15px 0; }}
-                    th, td {{ border: 1px solid #d1d5db; padding: 12px; text-align: left; }}
-                    th {{ background-color: #3b82f6; color: white; font-weight: bold; }}
-                    tr:nth-child(even) {{ background-color: #f9fafb; }}
-                    .status-go {{ color: #10b981; font-weight: bold; }}
-                    .status-nogo {{ color: #ef4444; font-weight: bold; }}
-                    .score {{ text-align: right; font-weight: bold; }}
-                    </style>
-                    </head>
-                    <body>
-                    
-                    <h1>🔬 16개 검증 시스템 분석 결과</h1>
-                    
-                    <h2>🎯 자동매매 판정</h2>
-                    <p>상태: <span class="status-{('go' if disq['status'] == '✅ GO' else 'nogo')}">{disq['status']}</span></p>
-                    <p>기준: {disq['tier']}</p>
-                    <p>이유:</p>
-                    <ul>
-                    """
-                    
-                    if disq['reasons']:
-                        for reason in disq['reasons']:
-                            html_content += f"<li>{reason}</li>"
-                    else:
-                        html_content += "<li>모든 검증 통과</li>"
-                    
-                    html_content += f"""
-                    </ul>
-                    
-                    <h2>📈 카테고리별 점수</h2>
-                    <table>
-                    <tr>
-                    <th>카테고리</th>
-                    <th>점수</th>
-                    </tr>
-                    """
-                    
-                    for category, score in final_score['scores'].items():
-                        html_content += f"<tr><td>{category}</td><td class='score'>{score:.1f}점</td></tr>"
-                    
-                    html_content += f"""
-                    </table>
-                    
-                    <h2>📊 종합 평가</h2>
-                    <p><strong>최종 점수:</strong> {final_score['final_score']:.1f}점</p>
-                    <p><strong>등급:</strong> {final_score['rating']}</p>
-                    <p><strong>판정:</strong> {disq['status']}</p>
-                    
-                    </body>
-                    </html>
-                    """
-                    
-                    st.download_button(
-                        label="📄 검증 결과 HTML 다운로드",
-                        data=html_content,
-                        file_name=f"validation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html",
-                        mime="text/html"
-                    )
-                    
-                    # JSON도 다운로드
-                    json_str = json.dumps(report, default=str, indent=2, ensure_ascii=False)
-                    st.download_button(
-                        label="📊 검증 결과 JSON 다운로드",
-                        data=json_str,
-                        file_name=f"validation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                        mime="application/json"
-                    )
+                    # 결과는 세션에 저장하고 아래 결과 영역에서 표시
+                    st.session_state['validator_report'] = report
+                    st.session_state['validator_report_key'] = trades_key
+                    st.session_state['validator_report_run_id'] = uuid.uuid4().hex
                 
                 except ImportError as e:
                     st.error(f"❌ 모듈 로드 실패: {e}")
@@ -459,8 +486,12 @@ def render_page_16_validators(converter_instance):
                 
                 except Exception as e:
                     st.error(f"❌ 검증 실패: {e}")
-                    import traceback
-                    st.code(traceback.format_exc())
+                    if st.session_state.get('show_tracebacks', False):
+                        st.code(traceback.format_exc())
+        
+        # ========== 검증 결과 표시 (fragment: 결과 영역 상호작용 시 이 영역만 재실행) ==========
+        if st.session_state.get('validator_report_key') == trades_key and 'validator_report' in st.session_state:
+            _render_results(st.session_state['validator_report'], st.session_state['validator_report_run_id'])
         
         st.markdown("---")
                     
@@ -489,5 +520,5 @@ def render_page_16_validators(converter_instance):
         
     except Exception as e:
         st.error(f"❌ 실패: {e}")
-        import traceback
-        st.code(traceback.format_exc())
\ No newline at end of file
+        if st.session_state.get('show_tracebacks', False):
+            st.code(traceback.format_exc())
\ No newline at end of file